@@ -7,6 +7,7 @@ import torch
 import torch.utils.data as data
 from PIL import Image
 import PIL
+import mmap
 import os
 import os.path
 import pickle
@@ -123,8 +124,23 @@ class TextDataset(data.Dataset):
         # > https://github.com/reedscot/cvpr2016
         # > https://arxiv.org/pdf/1605.05395.pdf
         
-        with open(os.path.join(data_dir, embedding_filename), 'rb') as f:
-            embeddings = pickle.load(f, encoding="bytes")
+        embedding_path = os.path.join(data_dir, embedding_filename)
+        # embeddings pickled with protocol 5 keep their ndarray payloads in a
+        # '<name>.bin' sidecar (see data/dataset_wrap.py); memory-map it back
+        buffers = None
+        if os.path.isfile(embedding_path + '.bin'):
+            with open(embedding_path + '.bin', 'rb') as fb:
+                payload = mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ)
+            count = int(np.frombuffer(payload, dtype=np.int64, count=1)[0])
+            sizes = np.frombuffer(payload, dtype=np.int64, count=count, offset=8)
+            view = memoryview(payload)
+            offset = 8 * (count + 1)
+            buffers = []
+            for size in sizes:
+                buffers.append(view[offset:offset + int(size)])
+                offset += int(size)
+        with open(embedding_path, 'rb') as f:
+            embeddings = pickle.load(f, encoding="bytes", buffers=buffers)
             embeddings = np.array(embeddings)
             # embedding_shape = [embeddings.shape[-1]]
             print('embeddings: ', embeddings.shape, "original dtype:", embeddings.dtype)
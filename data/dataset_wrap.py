@@ -0,0 +1,928 @@
+import hashlib
+import json
+import mmap
+import os
+import pathlib
+import pickle
+import re
+import shutil
+import sqlite3
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import ray
+import threading
+from voc_tools.reader import from_file
+from voc_tools.utils import VOCDataset, Dataset
+
+
+def save_pickle(obj, path):
+    """
+    Pickle 'obj' with protocol 5. Out-of-band buffers (large ndarray payloads)
+    are written raw to a sibling '<path>.bin' file, prefixed with their count and
+    sizes, so the pickler never copies them through intermediate bytes objects
+    and 'load_pickle' can memory-map them back.
+    """
+    buffers = []
+    # a 1 MiB write buffer keeps the many small pickle opcodes off the syscall path
+    with open(path, 'wb', buffering=1 << 20) as fpp:
+        pickle.dump(obj, fpp, protocol=5, buffer_callback=buffers.append)
+    bin_path = path + ".bin"
+    if buffers:
+        sizes = np.array([buf.raw().nbytes for buf in buffers], dtype=np.int64)
+        with open(bin_path, 'wb', buffering=1 << 20) as fpb:
+            fpb.write(np.int64(len(buffers)).tobytes())
+            fpb.write(sizes.tobytes())
+            for buf in buffers:
+                fpb.write(buf.raw())
+    elif os.path.isfile(bin_path):
+        # the object pickled self-contained this time; drop any stale sidecar
+        os.remove(bin_path)
+
+
+def load_pickle(path):
+    """
+    Counterpart of 'save_pickle'. When a '<path>.bin' sidecar exists, it is
+    memory-mapped and sliced into the out-of-band buffers expected by the pickle.
+    """
+    bin_path = path + ".bin"
+    buffers = None
+    if os.path.isfile(bin_path):
+        with open(bin_path, 'rb') as fpb:
+            payload = mmap.mmap(fpb.fileno(), 0, access=mmap.ACCESS_READ)
+        count = int(np.frombuffer(payload, dtype=np.int64, count=1)[0])
+        sizes = np.frombuffer(payload, dtype=np.int64, count=count, offset=8)
+        view = memoryview(payload)
+        offset = 8 * (count + 1)
+        buffers = []
+        for size in sizes:
+            buffers.append(view[offset:offset + int(size)])
+            offset += int(size)
+    with open(path, 'rb') as fpp:
+        return pickle.load(fpp, encoding="bytes", buffers=buffers)
+
+
+def generate_class_id_pickle(dataset_path, classes):
+    """
+    Generate and save CLASS_IDS into a pickle file
+
+    Args:
+        dataset_path: VOC dataset path
+        classes: a list of classes to add to dataset
+    """
+    dataset_path = pathlib.Path(dataset_path)
+    assert os.path.exists(str(dataset_path))
+    # categorical encoding of the classes; sorting keeps the ids stable across runs
+    unique = sorted(set(classes))
+    id_of = {class_name: index + 1 for index, class_name in enumerate(unique)}
+    class_id = [id_of[class_name] for class_name in classes]
+    # save as pickle file
+    pickle_class_info_path = str(dataset_path / "train" / "class_info.pickle")
+    save_pickle(class_id, pickle_class_info_path)
+    print("'{}' is created with {} entries".format(pickle_class_info_path, len(class_id)))
+
+
+class MMapWordVectors:
+    """
+    Minimal embedding-only stand-in for a fasttext model, backed by a
+    memory-mapped word-vector matrix. It supports the subset of the fasttext
+    API used by this module (get_dimension, get_word_vector, get_sentence_vector)
+    while loading in milliseconds instead of reading the whole *.bin model.
+    """
+
+    def __init__(self, matrix, vocab):
+        self.matrix = matrix
+        self.vocab = vocab
+
+    def get_dimension(self):
+        return self.matrix.shape[1]
+
+    def get_word_vector(self, word):
+        index = self.vocab.get(word)
+        if index is None:
+            return np.zeros(self.matrix.shape[1], dtype=np.float32)
+        return np.asarray(self.matrix[index], dtype=np.float32)
+
+    def get_sentence_vector(self, sentence):
+        rows = [self.vocab[token] for token in sentence.split() if token in self.vocab]
+        if not rows:
+            return np.zeros(self.matrix.shape[1], dtype=np.float32)
+        return np.asarray(self.matrix[rows].mean(axis=0), dtype=np.float32)
+
+
+def load_vec_model(vec_path):
+    """
+    Load a fasttext '.vec' text file as a MMapWordVectors model. The file is
+    parsed once and cached as a '<name>.npy' matrix plus '<name>.vocab.json';
+    subsequent runs memory-map the matrix directly.
+    """
+    npy_path = vec_path + ".npy"
+    vocab_path = vec_path + ".vocab.json"
+    if not (os.path.isfile(npy_path) and os.path.isfile(vocab_path)):
+        print("Parsing word vectors:{}...".format(vec_path), end="")
+        words = []
+        with open(vec_path, encoding="utf-8", errors="ignore") as fp:
+            n_words, dim = map(int, fp.readline().split())
+            matrix = np.empty((n_words, dim), dtype=np.float32)
+            for index, line in enumerate(fp):
+                pieces = line.rstrip().split(' ')
+                words.append(pieces[0])
+                matrix[index] = pieces[1:]
+        np.save(npy_path, matrix)
+        with open(vocab_path, 'w', encoding="utf-8") as fp:
+            json.dump(words, fp)
+        print("Cached as '{}'".format(npy_path))
+    with open(vocab_path, encoding="utf-8") as fp:
+        words = json.load(fp)
+    matrix = np.load(npy_path, mmap_mode='r')
+    return MMapWordVectors(matrix, {word: index for index, word in enumerate(words)})
+
+
+def get_embedding_model(fasttext_model_path=None, emb_dim=300):
+    """
+    Args:
+        fasttext_model_path: Pretrained fasttext  model (*.bin or *.vec) file path See: https://fasttext.cc/docs/en/crawl-vectors.html
+        emb_dim: Final embedding dimension
+    """
+    model = None
+    model_name = ""
+    if os.path.isfile(fasttext_model_path):
+        model_name = pathlib.Path(fasttext_model_path).name
+        if fasttext_model_path.endswith(".vec"):
+            # embedding-only workload: memory-map the word vectors instead of
+            # loading the full subword model
+            print("Loading word vectors:{}...".format(fasttext_model_path), end="")
+            model = load_vec_model(fasttext_model_path)
+            print("Loaded")
+            assert emb_dim == model.get_dimension(), \
+                "A '.vec' model cannot be reduced, expected dimension {} but got {}".format(
+                    emb_dim, model.get_dimension())
+        else:
+            import fasttext
+            import fasttext.util
+            reduced_path = "{}.{}d.bin".format(fasttext_model_path, emb_dim)
+            if os.path.isfile(reduced_path):
+                # reuse the PCA-reduced model cached by an earlier run
+                print("Loading reduced fasttext model:{}...".format(reduced_path), end="")
+                model = fasttext.load_model(reduced_path)
+                print("Loaded")
+            else:
+                print("Loading fasttext model:{}...".format(fasttext_model_path), end="")
+                model = fasttext.load_model(fasttext_model_path)
+                print("Loaded")
+                if emb_dim != model.get_dimension():
+                    fasttext.util.reduce_model(model, emb_dim)
+                    # cache the reduction so later runs skip the dense PCA
+                    model.save_model(reduced_path)
+    assert model is not None, "A fasttext  model has to be initialised"
+    return model, model_name, emb_dim
+
+
+def generate_text_embedding_pickle(dataset_path, embeddings, model_name, emb_dim, mode="train", quantize="none"):
+    """
+    Generate and save caption embedding into a pickle file.
+    Args:
+        dataset_path: VOC dataset path
+        embeddings: Prepared caption embeddings
+        model_name: Model name which is used to prepare the embeddings
+        emb_dim: Final embedding dimension
+        mode: Generate embeddings for training or testing
+        quantize: 'none', 'fp16' or 'int8' storage for the NPY mirror
+    """
+    assert mode in ("train", "test"), mode
+    dataset_path = pathlib.Path(dataset_path)
+    assert os.path.exists(str(dataset_path))
+    # save as pickle file
+    # contiguous payloads are picked up out-of-band by protocol 5; with 'fp16'
+    # the pickle itself is stored half-precision (the training loader upcasts
+    # to its own dtype on load), halving the artifact alongside the NPY mirror
+    store_dtype = np.float16 if quantize == "fp16" else np.float32
+    if isinstance(embeddings, np.ndarray):
+        embeddings = np.ascontiguousarray(embeddings, dtype=store_dtype)
+    else:
+        embeddings = [np.ascontiguousarray(emb, dtype=store_dtype) for emb in embeddings]
+    pickle_path = str(dataset_path / mode / "embeddings_{}_{}D.pickle".format(model_name, emb_dim))
+    save_pickle(embeddings, pickle_path)
+    print("'{}' is created with {} entries".format(pickle_path, len(embeddings)))
+    # NPY mirror: one contiguous (sum(sizes), emb_dim) matrix plus the group
+    # offsets, so consumers can memory-map instead of unpickling object-by-object
+    if isinstance(embeddings, np.ndarray) and embeddings.ndim == 3:
+        sizes = [embeddings.shape[1]] * embeddings.shape[0]
+        flat = np.ascontiguousarray(embeddings.reshape(-1, embeddings.shape[-1]))
+    else:
+        groups = [np.atleast_2d(emb) for emb in embeddings]
+        sizes = [len(group) for group in groups]
+        flat = np.concatenate(groups) if groups else np.empty((0, emb_dim), dtype=store_dtype)
+    quantized = quantize_embeddings(flat, quantize)
+    if quantize == "int8":
+        quantized, scale = quantized
+        np.save(pickle_path + ".scale.npy", scale)
+    np.save(pickle_path + ".npy", quantized)
+    np.save(pickle_path + ".offsets.npy", np.cumsum(sizes))
+    # compressed copy for disk/network transport, written only when blosc2 is installed
+    if save_compressed_embeddings(pickle_path + ".blosc", flat):
+        print("'{}' is created".format(pickle_path + ".blosc"))
+
+
+def quantize_embeddings(embeddings, mode):
+    """
+    Quantize a float32 embedding matrix for smaller artifacts. 'fp16' halves the
+    bytes with a plain cast; 'int8' quarters them, returning (values, per-row
+    scales). 'none' returns the matrix untouched.
+    """
+    assert mode in ("none", "fp16", "int8"), mode
+    if mode == "fp16":
+        return embeddings.astype(np.float16, copy=False)
+    if mode == "int8":
+        scale = np.abs(embeddings).max(axis=-1, keepdims=True) / 127.
+        scale[scale == 0] = 1.
+        return np.round(embeddings / scale).astype(np.int8), scale.astype(np.float16)
+    return embeddings
+
+
+def dequantize_embeddings(quantized, scale=None):
+    """Restore float32 embeddings written by 'quantize_embeddings'."""
+    if scale is None:
+        return np.asarray(quantized, dtype=np.float32)
+    return quantized.astype(np.float32) * np.asarray(scale, dtype=np.float32)
+
+
+def save_compressed_embeddings(path, embeddings):
+    """
+    Compress a contiguous embedding matrix with blosc2 (zstd + byte shuffle,
+    ~2-3x smaller for float32) and write it behind a small JSON header. Returns
+    False without writing when blosc2 is not installed.
+    """
+    try:
+        import blosc2
+    except ImportError:
+        return False
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    payload = blosc2.compress(embeddings.tobytes(), typesize=4, clevel=3,
+                              codec=blosc2.Codec.ZSTD, filter=blosc2.Filter.SHUFFLE)
+    header = json.dumps({"shape": list(embeddings.shape), "dtype": str(embeddings.dtype)}).encode("utf-8")
+    with open(path, 'wb') as fpp:
+        fpp.write(np.int64(len(header)).tobytes())
+        fpp.write(header)
+        fpp.write(payload)
+    return True
+
+
+def load_compressed_embeddings(path):
+    """Counterpart of 'save_compressed_embeddings'."""
+    import blosc2
+    with open(path, 'rb') as fpp:
+        header_size = int(np.frombuffer(fpp.read(8), dtype=np.int64)[0])
+        header = json.loads(fpp.read(header_size).decode("utf-8"))
+        payload = fpp.read()
+    matrix = np.frombuffer(blosc2.decompress(payload), dtype=header["dtype"])
+    return matrix.reshape(header["shape"])
+
+
+def load_embedding_npy(pickle_path, mmap_mode='r'):
+    """
+    Lazily load the NPY mirror written by generate_text_embedding_pickle and
+    rebuild the per-image embedding groups without touching the pickle.
+    """
+    flat = np.load(pickle_path + ".npy", mmap_mode=mmap_mode)
+    offsets = np.load(pickle_path + ".offsets.npy")
+    return np.split(flat, offsets[:-1])
+
+
+def generate_filename_pickle(dataset_path, filenames):
+    """
+    Generate a list of 'filenames' per 'caption', then save it as pickle format.
+    Note: This is not a unique filename list. If, for a certain image, we have multiple
+    captions, then multiple entries with same 'filename' will be created.
+
+    Args:
+        dataset_path: the path to the dataset
+    """
+    dataset_path = pathlib.Path(dataset_path)
+    assert os.path.exists(str(dataset_path))
+    
+    pickle_filenames_path = str(dataset_path / "train" / "filenames.pickle")
+    
+    # save as pickle file
+    save_pickle(filenames, pickle_filenames_path)
+    print("'{}' is created with {} entries".format(pickle_filenames_path, len(filenames)))
+
+
+STOP_WORDS = ['i', 'me', 'my', 'myself', 'we', 'our', 'ours', 'ourselves', 'you', "you're", "you've", "you'll", "you'd",
+              'your', 'yours', 'yourself', 'yourselves', 'he', 'him', 'his', 'himself', 'she', "she's", 'her', 'hers',
+              'herself', 'it', "it's", 'its', 'itself', 'they', 'them', 'their', 'theirs', 'themselves', 'what',
+              'which', 'who', 'whom', 'this', 'that', "that'll", 'these', 'those', 'am', 'is', 'are', 'was', 'were',
+              'be', 'been', 'being', 'have', 'has', 'had', 'having', 'do', 'does', 'did', 'doing', 'a', 'an', 'the',
+              'and', 'but', 'if', 'or', 'because', 'as', 'until', 'while', 'of', 'at', 'by', 'for', 'with', 'about',
+              'against', 'between', 'into', 'through', 'during', 'before', 'after', 'above', 'below', 'to', 'from',
+              'up', 'down', 'in', 'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here',
+              'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other',
+              'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very', 's', 't', 'can',
+              'will', 'just', 'don', "don't", 'should', "should've", 'now', 'd', 'll', 'm', 'o', 're', 've', 'y', 'ain',
+              'aren', "aren't", 'couldn', "couldn't", 'didn', "didn't", 'doesn', "doesn't", 'hadn', "hadn't", 'hasn',
+              "hasn't", 'haven', "haven't", 'isn', "isn't", 'ma', 'mightn', "mightn't", 'mustn', "mustn't", 'needn',
+              "needn't", 'shan', "shan't", 'shouldn', "shouldn't", 'wasn', "wasn't", 'weren', "weren't", 'won', "won't",
+              'wouldn', "wouldn't"]
+
+# precompiled cleaning helpers, compiled once per process instead of once per caption
+_CLEAN_PUNCT = re.compile(r"[^\w\s']")
+_CLEAN_WS = re.compile(r"\s+")
+_STOP = frozenset(STOP_WORDS)
+# a stopword only matches as a whole whitespace-delimited token (not on \b word
+# boundaries, which would mangle possessives/contractions and match trailing
+# punctuation differently), so the regex removes exactly the tokens that the
+# membership test in 'clean' drops
+_STOP_RE = re.compile(
+    r"(?:^|(?<=\s))(?:" + "|".join(map(re.escape, STOP_WORDS)) + r")(?=\s|$)")
+
+
+def _fnv1a(token):
+    # 64-bit FNV-1a fingerprint of a token
+    fingerprint = 0xcbf29ce484222325
+    for byte in token.encode("utf-8"):
+        fingerprint = ((fingerprint ^ byte) * 0x100000001b3) & 0xFFFFFFFFFFFFFFFF
+    return fingerprint
+
+
+_STOP_HASHES = np.sort(np.fromiter((_fnv1a(word) for word in STOP_WORDS), dtype=np.uint64))
+
+try:
+    import numba
+
+    @numba.njit(cache=True, parallel=True)
+    def _stopword_mask(token_hashes, stop_hashes):
+        # native binary search per token, parallelized over tokens;
+        # True marks tokens to keep
+        mask = np.empty(token_hashes.shape[0], dtype=np.bool_)
+        for i in numba.prange(token_hashes.shape[0]):
+            j = np.searchsorted(stop_hashes, token_hashes[i])
+            mask[i] = j >= stop_hashes.shape[0] or stop_hashes[j] != token_hashes[i]
+        return mask
+except ImportError:
+    numba = None
+
+    def _stopword_mask(token_hashes, stop_hashes):
+        # vectorized numpy fallback when numba is not installed
+        if token_hashes.shape[0] == 0:
+            return np.empty(0, dtype=np.bool_)
+        indices = np.minimum(np.searchsorted(stop_hashes, token_hashes), stop_hashes.shape[0] - 1)
+        return stop_hashes[indices] != token_hashes
+
+
+_worker_model = None
+
+
+def _init_embed_worker(fasttext_model_path, emb_dim):
+    """Pool initializer: load the fasttext model once per worker process."""
+    global _worker_model
+    _worker_model, _, _ = get_embedding_model(fasttext_model_path, emb_dim)
+
+
+def _embed_chunk(captions):
+    """Embed a chunk of captions with the model loaded by '_init_embed_worker'."""
+    embed = getattr(_worker_model, "get_sentence_vector", None) or _worker_model.get_word_vector
+    return np.stack([embed(sentence) for sentence in captions])
+
+
+class DatasetWrap:
+    def __init__(self, dataset_path, bulk=False, class_ids=False, fasttext_model_path=None,
+                 embedding_dimension=300, test_captions=None, emb_model=None, emb_model_name=None,
+                 quantize="none") -> None:
+        dataset_path = pathlib.Path(dataset_path)
+        assert os.path.exists(str(dataset_path))
+        self.dataset_path = pathlib.Path(dataset_path)
+        self.is_bulk = bulk
+        self.class_ids = class_ids
+        self.embedding_dim = embedding_dimension
+        self.test_captions = test_captions
+        self.quantize = quantize
+        self.fasttext_model_path = fasttext_model_path
+        if fasttext_model_path is not None:
+            # loading embedding
+            self.emb_model, self.emb_model_name, _ = get_embedding_model(fasttext_model_path, embedding_dimension)
+        else:
+            self.emb_model, self.emb_model_name = emb_model, emb_model_name
+        self.voc_data = VOCDataset(dataset_path, caption_support=True)
+        self._caption_cache = None
+
+    def _scan_captions(self):
+        """
+            Walk the caption set once and cache the per-caption filename, class name
+        and caption text, so the _prepare_* passes do not each re-scan the dataset
+        directory. Annotation files are parsed at most once per image.
+        """
+        if self._caption_cache is not None:
+            return
+        # joined once; rebuilding the Path per caption costs several allocations each,
+        # and the per-file path below becomes a plain string concat instead of a join
+        caption_prefix = str(self.dataset_path / "train" / Dataset.CAPTION_DIR) + os.sep
+        filenames, classes, texts = [], [], []
+        class_of = {}
+        # bound methods looked up once; attribute resolution per caption adds up
+        add_filename, add_text, add_class = filenames.append, texts.append, classes.append
+        for caption in self.voc_data.train.caption.fetch(bulk=False):
+            add_filename(caption.filename)
+            add_text(caption.captions)
+            if self.class_ids:
+                if caption.filename not in class_of:
+                    # only the first annotation is needed; next() stops the parse
+                    # there instead of materializing every annotation in the file
+                    class_of[caption.filename] = next(
+                        iter(from_file(caption_prefix + caption.filename))).class_name
+                add_class(class_of[caption.filename])
+        self._caption_cache = (filenames, classes, texts)
+
+    def _prepare_classes(self):
+        """
+            Each image typically contains one or many captions. In two ways we can save the 'class_ids'
+        into the pickle file, 'class_ids' per caption and 'class_ids' per image. 'bulk' parameter
+        controls this action.
+        """
+        if self.is_bulk:
+            # 'class_ids per image'
+            self.classes = [annotations[0].class_name for annotations, jpeg in self.voc_data.train.fetch(bulk=True)]
+        else:
+            # 'class_ids per caption'
+            self._scan_captions()
+            self.classes = list(self._caption_cache[1])
+        print("Class_id is prepared")
+    
+    def _prepare_filenames(self):
+        """
+            Each image typically contains one or many captions. In two ways we can save the filenames
+        into the pickle file, filename per caption and filename per image. 'bulk' parameter
+        controls this action.
+        """
+        dataset_path = self.dataset_path
+        
+        if self.is_bulk:
+            # os.scandir yields bare entry names directly, skipping the full-path
+            # build + os.path.basename round trip that list_dir would force here
+            image_dir_path = str(dataset_path / "train" / Dataset.IMAGE_DIR)
+            with os.scandir(image_dir_path) as entries:
+                mylist = sorted(entry.name for entry in entries if entry.is_file())
+        else:
+            # read the filenames from captions
+            self._scan_captions()
+            # slice off the fixed '.txt' suffix; str.replace would rescan the whole
+            # name and also corrupt filenames containing '.txt' mid-string
+            mylist = [filename[:-4] + ".jpg" for filename in self._caption_cache[0]]
+        image_dir = os.path.join("train", Dataset.IMAGE_DIR)  # joined once, outside the loop
+        self.filenames = [os.path.join(image_dir, x) for x in mylist]  # fill path names
+        print("Filenames is prepared")
+    
+    @staticmethod
+    def clean(text):
+        # remove stopwords, punctuation, space, linefeed etc.
+        text = text.lower()
+        text = " ".join(word for word in _CLEAN_WS.split(text) if word and word not in _STOP)
+        text = _CLEAN_PUNCT.sub(' ', text)
+        return _CLEAN_WS.sub(' ', text).strip()
+
+    @staticmethod
+    def clean_batch(texts):
+        """
+        Clean a batch of captions with the hashed stopword filter. All tokens are
+        fingerprinted into one uint64 array and masked in a single scan, which is
+        numba-jitted when numba is installed, so the per-token Python work is
+        limited to hashing and mask indexing.
+        """
+        token_lists = [[token for token in _CLEAN_WS.split(text.lower()) if token] for text in texts]
+        tokens = [token for tokens_ in token_lists for token in tokens_]
+        hashes = np.fromiter((_fnv1a(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+        mask = _stopword_mask(hashes, _STOP_HASHES)
+        cleaned, position = [], 0
+        for tokens_ in token_lists:
+            kept = [token for token, keep in zip(tokens_, mask[position:position + len(tokens_)]) if keep]
+            position += len(tokens_)
+            text = _CLEAN_PUNCT.sub(' ', " ".join(kept))
+            cleaned.append(_CLEAN_WS.sub(' ', text).strip())
+        return cleaned
+
+    @staticmethod
+    def clean_series(series):
+        """
+        Vectorized variant of DatasetWrap.clean over a pandas Series of captions.
+        The regex kernels run inside pandas (arrow-backed strings when pyarrow is
+        installed) instead of one Python call per row.
+        """
+        try:
+            series = series.astype("string[pyarrow]")
+        except (ImportError, TypeError):
+            series = series.astype("string")
+        return (series.str.lower()
+                .str.replace(_STOP_RE, ' ', regex=True)
+                .str.replace(_CLEAN_PUNCT, ' ', regex=True)
+                .str.replace(_CLEAN_WS, ' ', regex=True)
+                .str.strip())
+
+    def create_fasttext_data(self, captions):
+        # stream the captions to disk in bounded batches; no dedup, so fasttext
+        # keeps the term-frequency signal of the corpus. Each batch is cleaned
+        # through the hashed stopword filter in one scan.
+        with open("./temp_text_data.txt", "w", encoding="utf-8") as fp:
+            batch = []
+            for text in captions:
+                batch.append(text)
+                if len(batch) >= 10000:
+                    fp.write("\n".join(self.clean_batch(batch)) + "\n")
+                    batch = []
+            if batch:
+                fp.write("\n".join(self.clean_batch(batch)) + "\n")
+        return "./temp_text_data.txt"
+
+    def train_fasttext_model(self, caption_data, fasttext_cfg):
+        assert fasttext_cfg, "'fasttext_cfg' is required to train a fasttext model"
+        keys = ("epoch", "lr", "algorithm")
+        assert all(x in keys for x in
+                   fasttext_cfg.keys()), "The following keys are required:{} in 'fasttext_cfg'".format(keys)
+        # train embedding model
+        import fasttext
+        data_path = self.create_fasttext_data(caption_data)
+        model = fasttext.train_unsupervised(data_path, fasttext_cfg.algorithm, dim=self.embedding_dim, thread=4,
+                                            epoch=fasttext_cfg.epoch, lr=fasttext_cfg.lr)
+        self.emb_model = model
+        self.emb_model_name = "fasttext_{}_{}".format(fasttext_cfg.algorithm, self.embedding_dim)
+        # remove temporary files
+        os.remove(data_path)
+        print("Fasttext model is trained")
+    
+    def _prepare_embeddings(self, model, fasttext_cfg=None):
+        """
+            Each image typically contains one or many captions. In two ways we can save the caption
+        embeddings into the pickle file. In as single instance or in bulk. Let, say we have 3 captions per image, and we
+        have 2 images. If we want to store the embeddings as bulk, then it should look like:
+        [[emb11, emb12, emb13], [emb21, emb22, emb23]]. If we want to store the embeddings as single instance, then it will be:
+        [[emb11], [emb12], [emb13], [emb21], [emb22], [emb23]].
+        """
+        if model is None:
+            # train model on the caption corpus from the shared caption scan
+            # instead of walking the caption directory a second time
+            self._scan_captions()
+            caption_data = (text.strip().strip(".").strip() for text in self._caption_cache[2])
+            self.train_fasttext_model(caption_data, fasttext_cfg)
+            model = self.emb_model
+        
+        # sentence-transformers models expose a batched (optionally GPU) 'encode';
+        # everything else goes through the per-sentence fasttext-style API below
+        encode = getattr(model, "encode", None)
+        # fasttext's get_sentence_vector handles multi-word captions properly; fall back to
+        # get_word_vector for embedding models which do not expose it (e.g. OpenAIModelProxy)
+        embed = getattr(model, "get_sentence_vector", None) or getattr(model, "get_word_vector", None)
+        if self.is_bulk:
+            # at most 4 captions per image are embedded
+            captions_flat, group_sizes = [], []
+            for caption_list in self.voc_data.train.caption.fetch(bulk=True):
+                group = [cap.captions for cap in caption_list[:4]]
+                captions_flat.extend(group)
+                group_sizes.append(len(group))
+        else:
+            self._scan_captions()
+            # the cached list is read-only from here on; no defensive copy needed
+            captions_flat = self._caption_cache[2]
+            group_sizes = None
+        # with 'fp16' the working buffers are half precision end-to-end, halving
+        # peak memory while embedding; otherwise keep full float32 precision
+        emb_dtype = np.float16 if self.quantize == "fp16" else np.float32
+        workers = os.cpu_count() or 1
+        if encode is not None:
+            # one batched forward pass; the model runs on whatever device it was
+            # constructed with (e.g. CUDA), so no per-sentence Python overhead
+            out = encode(captions_flat, batch_size=256, convert_to_numpy=True,
+                         show_progress_bar=True, normalize_embeddings=True).astype(emb_dtype, copy=False)
+        elif self.fasttext_model_path is not None and workers > 1 and len(captions_flat) > workers:
+            # each worker loads the model exactly once (in the initializer) and then
+            # embeds many small chunks, scaling the CPU-bound pass with core count
+            # while keeping the per-worker load cost independent of the chunk count
+            # array_split pads with empty chunks when captions are fewer than
+            # workers * 4; drop them, np.stack rejects an empty sequence
+            chunks = [list(chunk) for chunk in np.array_split(captions_flat, workers * 4) if len(chunk)]
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_embed_worker,
+                                     initargs=(self.fasttext_model_path, self.embedding_dim)) as executor:
+                parts = list(executor.map(_embed_chunk, chunks))
+            out = np.concatenate(parts).astype(emb_dtype, copy=False)
+        else:
+            # one contiguous (N, emb_dim) buffer instead of N tiny per-caption allocations
+            out = np.empty((len(captions_flat), self.embedding_dim), dtype=emb_dtype)
+            for i, sentence in enumerate(captions_flat):
+                out[i] = embed(sentence)
+        if self.is_bulk:
+            if group_sizes and len(set(group_sizes)) == 1:
+                # uniform groups pickle as one contiguous 3-D tensor (a single
+                # out-of-band buffer) instead of a list of per-image arrays
+                self.embeddings = out.reshape(len(group_sizes), group_sizes[0], -1)
+            else:
+                self.embeddings = np.split(out, np.cumsum(group_sizes)[:-1])
+        else:
+            self.embeddings = out[:, None, :]
+        print("Text embeddings is prepared for training")
+        if self.test_captions is not None:
+            if encode is not None:
+                test_out = encode(list(self.test_captions), batch_size=256, convert_to_numpy=True,
+                                  show_progress_bar=True, normalize_embeddings=True).astype(emb_dtype, copy=False)
+            else:
+                # batched into one buffer, same as the training captions above.
+                # test captions come straight from readlines(), so strip the
+                # trailing newline that get_sentence_vector refuses to accept
+                test_out = np.empty((len(self.test_captions), self.embedding_dim), dtype=emb_dtype)
+                for i, sentence in enumerate(self.test_captions):
+                    test_out[i] = embed(sentence.strip())
+            self.test_embeddings = test_out
+            print("Text embeddings is prepared for testing")
+    
+    def _embedding_cache_path(self):
+        # content-addressed: keyed by model, dimension, quantize mode, the
+        # caption filenames and the caption texts themselves, so re-runs over an
+        # unchanged dataset skip the embedding pass while edited captions
+        # (re-exported under the same file names) miss the cache
+        if not self.emb_model_name or self.test_captions is not None:
+            return None
+        # the scan is warmed only when the cache is actually in play; the
+        # quantize mode is part of the key because it decides the dtype of the
+        # cached buffers, so an fp16 cache must never satisfy a float32 run
+        self._scan_captions()
+        hasher = hashlib.sha256()
+        parts = [self.emb_model_name, str(self.embedding_dim), self.quantize]
+        for part in parts + sorted(self.filenames) + list(self._caption_cache[2]):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\n")
+        key = hasher.hexdigest()[:16]
+        return str(self.dataset_path / "train" / "embeddings_cache_{}.npy".format(key))
+
+    def prepare_dataset(self, fasttext_cfg=None):
+        # the bulk branches fetch their own data and never read the caption
+        # cache, so the shared scan is only warmed for the non-bulk passes
+        if not self.is_bulk:
+            self._scan_captions()
+        if self.class_ids:
+            self._prepare_classes()
+        self._prepare_filenames()
+        cache_path = self._embedding_cache_path()
+        if cache_path is not None and os.path.isfile(cache_path):
+            print("Reusing cached embeddings from '{}'".format(cache_path))
+            self.embeddings = np.load(cache_path, mmap_mode='r')
+        else:
+            self._prepare_embeddings(self.emb_model, fasttext_cfg)
+            if cache_path is not None and isinstance(self.embeddings, np.ndarray):
+                np.save(cache_path, self.embeddings)
+        generate_filename_pickle(str(self.dataset_path), self.filenames)
+        if self.class_ids:
+            generate_class_id_pickle(str(self.dataset_path), self.classes)
+        generate_text_embedding_pickle(str(self.dataset_path), self.embeddings, self.emb_model_name,
+                                       self.embedding_dim, quantize=self.quantize)
+        if self.test_captions is not None:
+            generate_text_embedding_pickle(str(self.dataset_path), self.test_embeddings, self.emb_model_name,
+                                           self.embedding_dim, mode="test", quantize=self.quantize)
+
+
+class Caption:
+    def __init__(self, items):
+        self.idx = items[0]
+        self.file_id = items[1]
+        self.filename = self.file_id.replace(".jpg", ".txt")
+        self.caption = items[2]
+        self.author = items[3]
+        self.is_occluded = items[4]
+        self.is_error = items[5]
+
+
+_grammar_tool = None
+
+
+def check_grammar(text):
+    # Create a LanguageTool instance lazily and reuse it: every instance spawns
+    # its own JVM-backed server, which costs seconds per construction
+    global _grammar_tool
+    try:
+        if _grammar_tool is None:
+            from language_tool_python import LanguageTool
+            _grammar_tool = LanguageTool('en-US')
+
+        # Check grammar in the text
+        matches = _grammar_tool.check(text)
+        return matches
+    except:
+        return []
+
+
+class SQLiteDataWrap:
+    # create locks
+    file_locks = defaultdict(lambda: threading.Lock())
+    
+    def __init__(self, dbpath):
+        assert os.path.isfile(dbpath), dbpath
+        conn = sqlite3.connect(dbpath)
+        self.conn = conn
+        self.dbpath = dbpath
+        self.image_path_dict = None
+        self._df = None
+        # this is a tricky approach to create/use locks during runtime instead of running an additional loop to
+
+    @property
+    def dataframe(self):
+        # built lazily: export() streams its own cursor and never needs the frame.
+        # Only the caption column is selected and it is streamed in chunks, so peak
+        # memory stays bounded by the chunk size instead of the whole table.
+        if self._df is None:
+            chunks = pd.read_sql_query("SELECT caption FROM caption", self.conn, chunksize=100000)
+            self._df = pd.concat(chunks, ignore_index=True)
+            self._df['caption'] = self._df['caption'].str.replace("\n", " ", regex=False)
+        return self._df
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+    
+    def get_path(self, file_id, image_paths):
+        if self.image_path_dict is None:
+            # one-time O(M) index over the image paths; every lookup afterwards is O(1)
+            self.image_path_dict = {os.path.basename(path): path for path in image_paths}
+        return self.image_path_dict.get(file_id)
+    
+    @staticmethod
+    def to_nested(stats):
+        """Expand {(group, metric): count} statistics into the nested dict shape."""
+        nested = defaultdict(lambda: defaultdict(lambda: 0))
+        for (group, metric), value in stats.items():
+            nested[group][metric] += value
+        return nested
+
+    @staticmethod
+    def publish_image(src, dst):
+        # hardlink is a metadata-only operation; fall back to a real copy when
+        # source and destination live on different filesystems
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    @staticmethod
+    @ray.remote
+    def file_writer(filename, caption):
+        with SQLiteDataWrap.file_locks[filename]:
+            with open(filename, 'a+') as fp:
+                fp.seek(0)
+                lines = fp.readlines()
+                if caption + "\n" in lines:
+                    # statistics[caption.filename]['duplicate'] += 1
+                    # statistics["caption"]['duplicate'] += 1
+                    pass
+                elif len(caption.split(" ")) < 2:
+                    # statistics[caption.filename]['faulty'] += 1
+                    # statistics["caption"]['faulty'] += 1
+                    pass
+                else:
+                    fp.write(caption.replace("\n", " ").strip() + "\n")
+                    # check grammar
+                    # errors = check_grammar(caption.caption)
+                    # save statistics
+                    # statistics[caption.filename]['caption'] += 1
+                    # statistics[caption.filename]['grammar'] += len(errors) > 0
+                    # statistics["caption"]['total'] += 1
+                    # statistics['grammar']['error-sentence'] += len(errors) > 0
+                    # statistics['grammar']['total-error'] += len(errors)
+    
+    def export_fast(self, data_root, clean=False, copy_images=False, image_paths=()):
+        data_root = pathlib.Path(data_root)
+        print("Initializing Ray...", end="")
+        ray.init()
+        print("DONE")
+        
+        # defining paths
+        caption_root = data_root / "train" / Dataset.CAPTION_DIR
+        image_root = data_root / "train" / Dataset.IMAGE_DIR
+        if clean:
+            print("Cleaning previous data...", end="")
+            # deleting directories
+            shutil.rmtree(caption_root, ignore_errors=True)
+            shutil.rmtree(image_root, ignore_errors=True)
+            print("Done")
+        # create directories
+        os.makedirs(caption_root, exist_ok=True)
+        os.makedirs(image_root, exist_ok=True)
+        os.makedirs(data_root / "test" / Dataset.IMAGE_DIR, exist_ok=True)
+        os.makedirs(data_root / "test" / Dataset.IMAGE_DIR, exist_ok=True)
+        
+        stats = Counter()
+        # taking DB cursor and running queries
+        print("Querying dataset form SQLITE...")
+        curr = self.conn.cursor()
+        count = curr.execute("SELECT count(*) FROM caption").fetchone()[0]
+        dataset = curr.execute("SELECT * FROM caption")
+        print("Creating dataset form SQLITE...", )
+        task_counter = 0
+        copied = set()
+        for idx, data in enumerate(dataset):
+            print("\r{}/{} {}% ".format(idx, (count - 1), round((idx / (count - 1) * 100.), 2)), end="\b")
+            caption = Caption(data)
+            if copy_images and caption.file_id not in copied:
+                # publishing each image once, no matter how many captions it has
+                filepath = self.get_path(caption.file_id, image_paths)
+                if not os.path.isfile(image_root / caption.file_id):
+                    self.publish_image(filepath, image_root / caption.file_id)
+                copied.add(caption.file_id)
+            # write to file using ray
+            self.file_writer.remote(caption_root / caption.filename, caption.caption)
+            task_counter += 1
+            # # creating the caption files
+            # with open(caption_root / caption.filename, "a+") as fp:
+            #     fp.seek(0)
+            #     lines = fp.readlines()
+            #     if caption.caption + "\n" in lines:
+            #         statistics[caption.filename]['duplicate'] += 1
+            #         statistics["caption"]['duplicate'] += 1
+            #     elif len(caption.caption.split(" ")) < 2:
+            #         statistics[caption.filename]['faulty'] += 1
+            #         statistics["caption"]['faulty'] += 1
+            #     else:
+            #         fp.write(caption.caption.replace("\n", " ") + "\n")
+            #         # check grammar
+            #         errors = check_grammar(caption.caption)
+            #         # save statistics
+            #         statistics[caption.filename]['caption'] += 1
+            #         statistics[caption.filename]['grammar'] += len(errors) > 0
+            #         statistics["caption"]['total'] += 1
+            #         statistics['grammar']['error-sentence'] += len(errors) > 0
+            #         statistics['grammar']['total-error'] += len(errors)
+        print("Waiting for Ray...", end="")
+        ray.wait([], num_returns=task_counter)
+        print("Shutting-down Ray")
+        ray.shutdown()
+        print("Done")
+        return self.to_nested(stats)
+    
+    def check(self, data_root):
+        """Check if all files contain all texts"""
+        df = pd.read_sql_query("SELECT * FROM captions", self.conn)
+        caption_count_per_file = df['file_id'].value_counts()
+    
+    def export(self, data_root, clean=False, copy_images=False, image_paths=()):
+        data_root = pathlib.Path(data_root)
+        
+        # defining paths
+        caption_root = data_root / "train" / Dataset.CAPTION_DIR
+        image_root = data_root / "train" / Dataset.IMAGE_DIR
+        if clean:
+            print("Cleaning previous data...", end="")
+            # deleting directories
+            shutil.rmtree(caption_root, ignore_errors=True)
+            shutil.rmtree(image_root, ignore_errors=True)
+            print("Done")
+        # create directories
+        os.makedirs(caption_root, exist_ok=True)
+        os.makedirs(image_root, exist_ok=True)
+        os.makedirs(data_root / "test" / Dataset.IMAGE_DIR, exist_ok=True)
+        os.makedirs(data_root / "test" / Dataset.IMAGE_DIR, exist_ok=True)
+        
+        # one flat counter keyed by (group, metric) instead of a dict-per-filename
+        stats = Counter()
+        # taking DB cursor and running queries
+        print("Querying dataset form SQLITE...")
+        curr = self.conn.cursor()
+        count = curr.execute("SELECT count(*) FROM caption").fetchone()[0]
+        # grouping rows by file lets each caption file be deduplicated with an
+        # in-memory set and written with a single syscall
+        dataset = curr.execute("SELECT * FROM caption ORDER BY file_id")
+        print("Creating dataset form SQLITE...", )
+
+        def flush(filename, captions):
+            # one write per file; grammar is checked on the accepted captions in one call
+            with open(caption_root / filename, "w") as fp:
+                fp.write("\n".join(captions) + "\n")
+            errors = check_grammar("\n".join(captions))
+            stats[(filename, 'grammar')] += len(errors) > 0
+            stats[('grammar', 'error-sentence')] += len(errors) > 0
+            stats[('grammar', 'total-error')] += len(errors)
+
+        current_file, seen, buffer = None, set(), []
+        copied = set()
+        for idx, data in enumerate(dataset):
+            print("\r{}/{} {}% ".format(idx, (count - 1), round((idx / (count - 1) * 100.), 2)), end="\b")
+            caption = Caption(data)
+            if copy_images and caption.file_id not in copied:
+                # publishing each image once, no matter how many captions it has
+                filepath = self.get_path(caption.file_id, image_paths)
+                if not os.path.isfile(image_root / caption.file_id):
+                    self.publish_image(filepath, image_root / caption.file_id)
+                copied.add(caption.file_id)
+
+            if caption.filename != current_file:
+                if buffer:
+                    flush(current_file, buffer)
+                current_file, seen, buffer = caption.filename, set(), []
+            text = caption.caption.replace("\n", " ").strip()
+            if text in seen:
+                stats.update(((caption.filename, 'duplicate'), ("caption", 'duplicate')))
+            elif len(text.split(" ")) < 2:
+                stats.update(((caption.filename, 'faulty'), ("caption", 'faulty')))
+            else:
+                seen.add(text)
+                buffer.append(text)
+                stats.update(((caption.filename, 'caption'), ("caption", 'total')))
+        if buffer:
+            flush(current_file, buffer)
+        print("Done")
+        return self.to_nested(stats)
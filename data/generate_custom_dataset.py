@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import os
 import pathlib
 import sqlite3
@@ -30,6 +31,16 @@ def parse_args():
     parser.add_argument('--fasttext_train_epoch', dest='fasttext_train_epoch', type=int, default=None)
     parser.add_argument('--fasttext_model', dest='fasttext_model', type=str, default=None)
     parser.add_argument('--emb_dim', dest='emb_dim', type=int, default=300)
+    parser.add_argument('--encoder', dest='encoder', type=str, default='fasttext',
+                        choices=['fasttext', 'st'],
+                        help="Caption encoder: fasttext or a sentence-transformers model ('st')")
+    parser.add_argument('--st_model', dest='st_model', type=str, default='all-MiniLM-L6-v2',
+                        help="sentence-transformers model name, used with --encoder st")
+    parser.add_argument('--st_device', dest='st_device', type=str, default='cuda',
+                        help="Device for the sentence-transformers model, e.g. cuda or cpu")
+    parser.add_argument('--quantize', dest='quantize', type=str, default='none',
+                        choices=['none', 'fp16', 'int8'],
+                        help="Storage precision for the saved embedding matrix")
     parser.add_argument('--openai_emb_db', dest='openai_emb_db', type=str, default=None)
     parser.add_argument('--sqlite', dest='sqlite',
                         help='Path to SQLite3 database file.',
@@ -63,16 +74,23 @@ def generate_dataset(args):
         emb_model = OpenAIModelProxy(args.openai_emb_db)
         emb_name = "openai"
         args.emb_dim = emb_model.dim
+    elif args.encoder == 'st':
+        # GPU-backed batched encoder; DatasetWrap picks the batched path up
+        # through the model's 'encode' method
+        from sentence_transformers import SentenceTransformer
+        emb_model = SentenceTransformer(args.st_model, device=args.st_device)
+        emb_name = args.st_model.replace('/', '-')
+        args.emb_dim = emb_model.get_sentence_embedding_dimension()
     else:
         emb_model = None
         emb_name = None
-    
+
     # initialize dataset
     vdw = DatasetWrap(args.data_dir, args.bulk, args.class_id,
                       fasttext_model_path=args.fasttext_model,
                       embedding_dimension=args.emb_dim,
                       test_captions=test_captions, emb_model=emb_model,
-                      emb_model_name=emb_name)
+                      emb_model_name=emb_name, quantize=args.quantize)
     vdw.prepare_dataset(fasttext_cfg)
 
 
@@ -104,52 +122,65 @@ def create_openai_embedding_database(generate=False):
         
         # initialize dataset
         voc_data = VOCDataset(args.data_dir, caption_support=True)
-        unique_captions = list(
-            set(list(map(lambda c: DatasetWrap.clean(c.captions), voc_data.train.caption.fetch(bulk=False)))))
+        # clean the captions in one vectorized pass instead of one clean() call per row
+        captions = pd.Series([c.captions for c in voc_data.train.caption.fetch(bulk=False)])
+        unique_captions = DatasetWrap.clean_series(captions).drop_duplicates().tolist()
         # add additional captions
-        unique_captions.extend(list(map(DatasetWrap.clean, additional_captions)))
-        unique_captions = list(filter(lambda txt: not emb_db.is_available(txt), unique_captions))
+        if additional_captions:
+            unique_captions.extend(DatasetWrap.clean_series(pd.Series(list(additional_captions))).tolist())
+        # set-difference against the preloaded content digests of the embedding DB
+        known = emb_db.keys()
+        unique_captions = [txt for txt in unique_captions if OpenAITextEmbeddingDB.digest(txt) not in known]
         Data.total_sentence = len(unique_captions)
-        Data.total_tokens = sum(map(lambda x: len(x), unique_captions))
+        Data.total_tokens = sum(len(txt) for txt in unique_captions)
         print("Unique captions cleaned:", Data.total_sentence)
         print("Total tokens:", Data.total_tokens)
-        return [[
-            "quick brown fox jump dog", "my name soumen sardar"
-        ]]
         return unique_captions
-    
-    caption_loader = caption_loader(test_captions)
-    bulk_embedded = True
+
+    # materialize once and reuse; every invocation re-scans the dataset and re-cleans
+    captions = caption_loader(test_captions)
     # rpm = 3
-    # bulk_caption_loader = OpenAITextLoader(caption_loader, Data.total_tokens, Data.total_sentence,
+    # bulk_caption_loader = OpenAITextLoader(captions, Data.total_tokens, Data.total_sentence,
     #                                        rpm=rpm,
     #                                        tpm=150000, auto_sleep=False)
-    # model = OpenAIEmbeddings(openai_api_key=key, model="ada", max_retries=1)
-    # embedding = model.embed_documents([""])
     cred_man = OpenAICredentialManager("./data/openai.apikey")
     cm = iter(cred_man)
     key, nickname = next(cm)
-    for caption in tqdm(caption_loader):
-        while True:
+
+    async def embed_wave(model, wave):
+        # overlap the HTTP latency of several batched embedding requests
+        return await asyncio.gather(*(model.aembed_documents(list(chunk)) for chunk in wave))
+
+    chunk_size = 256  # captions per request
+    concurrency = 4  # batched requests kept in flight
+    chunks = [captions[i:i + chunk_size] for i in range(0, len(captions), chunk_size)]
+    progress = tqdm(total=len(chunks))
+    commit_every = 2000  # appended rows between two DB flushes
+    pending_rows = 0
+    try:
+        while chunks:
             model = OpenAIEmbeddings(openai_api_key=key, model="ada", max_retries=1)
             try:
                 if cred_man.is_limit_exhausted(nickname):
                     raise RateLimitError("Rate limit exhausted for {}".format(nickname))
-                
-                if bulk_embedded:
-                    embeddings = model.embed_documents(caption)
-                    print(caption, embeddings)
-                else:
-                    # single
-                    embedding = model.embed_query(caption)
-                    emb_db.append(caption, embedding)
+                wave = chunks[:concurrency]
+                for chunk, vectors in zip(wave, asyncio.run(embed_wave(model, wave))):
+                    emb_db.append_many(zip(chunk, vectors))
+                    pending_rows += len(chunk)
+                # amortize the flush cost across many rows instead of per wave
+                if pending_rows >= commit_every:
                     emb_db.commit()
-                    # time.sleep(60 / rpm)
-                
-                break
+                    pending_rows = 0
+                chunks = chunks[concurrency:]
+                progress.update(len(wave))
             except RateLimitError:
                 cred_man.set_limit_exhausted(nickname)
                 key, nickname = next(cm)
+    finally:
+        # flush whatever was appended, also on KeyboardInterrupt
+        if pending_rows:
+            emb_db.commit()
+        progress.close()
     
     # For generating dataset
     if generate: